@@ -0,0 +1,80 @@
+"""Memory benchmark: bytes per rule for the legacy dataclass vs the slotted Rule.
+
+Run from the repository root:
+
+    python -m benchmarks.rule_memory [rule_count]
+
+Rules are generated from raw records the way a per-team rule pack loader
+would produce them, so every record carries its own copies of the category
+and tag strings. Everything the rule list keeps alive after loading is
+counted; description and example text is shared by all generated rules.
+"""
+
+import gc
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable
+from typing import List
+
+from src.rules.base import Rule
+
+CATEGORIES = ["Formatting", "Imports", "Lookup", "Variables", "Time", "DTO"]
+TAGS = ["naming", "lombok", "structure", "immutability", "formatting", "collections", "boolean"]
+
+
+@dataclass
+class LegacyRule:
+    id: str
+    category: str
+    tags: List[str]
+    name: str
+    description: str
+    wrong_example: str
+    correct_example: str
+
+
+def generate_records(count: int) -> List[dict]:
+    description = "Generated rule description."
+    wrong_example = "public class Wrong {}"
+    correct_example = "public class Correct {}"
+    return [
+        {
+            "id": f"GEN_{i:06d}",
+            # Build fresh string objects, as a JSON/YAML loader would.
+            "category": "".join(CATEGORIES[i % len(CATEGORIES)]),
+            "tags": ["".join(TAGS[(i + k) % len(TAGS)]) for k in range(3)],
+            "name": f"Generated rule {i}",
+            "description": description,
+            "wrong_example": wrong_example,
+            "correct_example": correct_example,
+        }
+        for i in range(count)
+    ]
+
+
+def measure(factory: Callable[..., object], count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    records = generate_records(count)
+    rules = [factory(**record) for record in records]
+    del records
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del rules
+    return retained / count
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    legacy = measure(LegacyRule, count)
+    slotted = measure(Rule, count)
+    print(f"rules:            {count}")
+    print(f"legacy dataclass: {legacy:8.1f} bytes/rule")
+    print(f"slotted Rule:     {slotted:8.1f} bytes/rule")
+    print(f"saving:           {100 * (1 - slotted / legacy):7.1f}%")
+
+
+if __name__ == "__main__":
+    main()
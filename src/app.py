@@ -1,10 +1,18 @@
+import os
+
 import uvicorn
 
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 
+from src.rules import SHARED_RULES_DIGEST_ENV
+from src.rules import SHARED_RULES_PATH_ENV
+from src.rules import build_rules
+from src.rules.shared import publish_rules
 from src.server import mcp
 
+WORKERS = int(os.environ.get("WEB_CONCURRENCY", "1"))
+
 app = FastAPI()
 
 
@@ -18,4 +26,10 @@ app.mount("/", mcp_asgi)
 
 
 if __name__ == "__main__":
-    uvicorn.run("src.app:app", host="0.0.0.0", port=80)
+    # Publish before forking: spawned workers inherit the digest and attach to
+    # exactly this blob. This process built its rules in-process, since no
+    # digest was set when it imported src.rules.
+    shared_path = os.environ.get(SHARED_RULES_PATH_ENV)
+    if shared_path and WORKERS > 1:
+        os.environ[SHARED_RULES_DIGEST_ENV] = publish_rules(build_rules(), shared_path)
+    uvicorn.run("src.app:app", host="0.0.0.0", port=80, workers=WORKERS)
@@ -1,65 +1,94 @@
+import logging
+import os
+from typing import FrozenSet
 from typing import List
 from typing import Optional
+from typing import Sequence
 
 from src.rules.base import Rule
-from src.rules.dto import RULES as DTO_RULES
-from src.rules.formatting import RULES as FORMATTING_RULES
-from src.rules.imports import RULES as IMPORTS_RULES
-from src.rules.lookup import RULES as LOOKUP_RULES
-from src.rules.time_and_date import RULES as TIME_RULES
-from src.rules.variables import RULES as VARIABLES_RULES
-
-JAVA_RULES: List[Rule] = [
-    *FORMATTING_RULES,
-    *IMPORTS_RULES,
-    *LOOKUP_RULES,
-    *VARIABLES_RULES,
-    *TIME_RULES,
-    *DTO_RULES,
-]
+from src.rules.base import find_symbols
+from src.rules.base import symbol_name
+from src.rules.registry import InProcessRuleList
+from src.rules.registry import RuleRegistry
+from src.rules.shared import SharedRuleList
+
+SHARED_RULES_PATH_ENV = "JAVA_RULES_SHARED_PATH"
+SHARED_RULES_DIGEST_ENV = "JAVA_RULES_SHARED_DIGEST"
+
+logger = logging.getLogger(__name__)
+
+
+def build_rules() -> List[Rule]:
+    # Imported here so workers attached to the shared registry never load
+    # the rule modules or build their example strings.
+    from src.rules.dto import RULES as DTO_RULES
+    from src.rules.formatting import RULES as FORMATTING_RULES
+    from src.rules.imports import RULES as IMPORTS_RULES
+    from src.rules.lookup import RULES as LOOKUP_RULES
+    from src.rules.time_and_date import RULES as TIME_RULES
+    from src.rules.variables import RULES as VARIABLES_RULES
+
+    return [
+        *FORMATTING_RULES,
+        *IMPORTS_RULES,
+        *LOOKUP_RULES,
+        *VARIABLES_RULES,
+        *TIME_RULES,
+        *DTO_RULES,
+    ]
+
+
+def _load_rules() -> RuleRegistry:
+    shared_path = os.environ.get(SHARED_RULES_PATH_ENV)
+    shared_digest = os.environ.get(SHARED_RULES_DIGEST_ENV)
+    if shared_path and shared_digest:
+        try:
+            return SharedRuleList(shared_path, shared_digest)
+        except (OSError, ValueError) as e:
+            logger.warning("Shared rule registry unavailable, building rules in-process: %s", e)
+    return InProcessRuleList(build_rules())
+
+
+JAVA_RULES: RuleRegistry = _load_rules()
+
+
+def _select(category_ids: FrozenSet[int], tag_ids: FrozenSet[int]) -> List[Rule]:
+    # Match on symbol ids only, so the shared registry decodes just the returned rules.
+    return [
+        JAVA_RULES[i]
+        for i, (category_id, rule_tag_ids) in enumerate(JAVA_RULES.symbol_rows())
+        if category_id in category_ids or not tag_ids.isdisjoint(rule_tag_ids)
+    ]
 
 
 def get_rules_by_category(category: str) -> List[Rule]:
-    return [rule for rule in JAVA_RULES if rule.category.lower() == category.lower()]
+    return _select(find_symbols([category]), frozenset())
 
 
 def get_rules_by_tag(tag: str) -> List[Rule]:
-    return [rule for rule in JAVA_RULES if tag.lower() in [t.lower() for t in rule.tags]]
+    return _select(frozenset(), find_symbols([tag]))
 
 
 def get_rules_filtered(
     categories: Optional[List[str]] = None,
     tags: Optional[List[str]] = None
-) -> List[Rule]:
+) -> Sequence[Rule]:
     if not categories and not tags:
         return JAVA_RULES
 
-    matched_ids: set = set()
-
-    if categories:
-        categories_lower = {c.lower() for c in categories}
-        matched_ids |= {r.id for r in JAVA_RULES if r.category.lower() in categories_lower}
-
-    if tags:
-        tags_lower = {t.lower() for t in tags}
-        matched_ids |= {r.id for r in JAVA_RULES if any(t.lower() in tags_lower for t in r.tags)}
-
-    return [r for r in JAVA_RULES if r.id in matched_ids]
+    return _select(find_symbols(categories or []), find_symbols(tags or []))
 
 
 def get_all_categories() -> List[str]:
-    return sorted(set(rule.category for rule in JAVA_RULES))
+    return sorted({symbol_name(category_id) for category_id, _ in JAVA_RULES.symbol_rows()})
 
 
 def get_all_tags() -> List[str]:
-    tags = set()
-    for rule in JAVA_RULES:
-        tags.update(rule.tags)
-    return sorted(tags)
+    tag_ids = set()
+    for _, rule_tag_ids in JAVA_RULES.symbol_rows():
+        tag_ids.update(rule_tag_ids)
+    return sorted(symbol_name(t) for t in tag_ids)
 
 
 def get_rule_by_id(rule_id: str) -> Rule | None:
-    for rule in JAVA_RULES:
-        if rule.id == rule_id:
-            return rule
-    return None
+    return JAVA_RULES.get(rule_id)
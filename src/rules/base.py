@@ -1,14 +1,122 @@
 from dataclasses import dataclass
-from dataclasses import field
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
 from typing import List
+from typing import Tuple
 
+# Category and tag names are interned into one process-wide symbol table so
+# every rule stores small integer ids instead of its own copies of the strings.
+_SYMBOLS: List[str] = []
+_SYMBOL_IDS: Dict[str, int] = {}
+_SYMBOL_IDS_LOWER: Dict[str, FrozenSet[int]] = {}
 
-@dataclass
+
+def intern_symbol(name: str) -> int:
+    symbol_id = _SYMBOL_IDS.get(name)
+    if symbol_id is None:
+        symbol_id = len(_SYMBOLS)
+        _SYMBOLS.append(name)
+        _SYMBOL_IDS[name] = symbol_id
+        key = name.lower()
+        _SYMBOL_IDS_LOWER[key] = _SYMBOL_IDS_LOWER.get(key, frozenset()) | {symbol_id}
+    return symbol_id
+
+
+def symbol_name(symbol_id: int) -> str:
+    return _SYMBOLS[symbol_id]
+
+
+def find_symbols(names: Iterable[str]) -> FrozenSet[int]:
+    """Return ids of all symbols matching any of the names, case-insensitively."""
+    found: FrozenSet[int] = frozenset()
+    for name in names:
+        found |= _SYMBOL_IDS_LOWER.get(name.lower(), frozenset())
+    return found
+
+
+@dataclass(frozen=True, slots=True, init=False, repr=False)
 class Rule:
+    """Rule record built from category and tag names.
+
+    ``category_id`` and ``tag_ids`` are process-local symbol ids, so
+    ``dataclasses.replace()`` and ``dataclasses.asdict()`` are not supported.
+    Use ``__replace__`` (``copy.replace`` on Python 3.13+) to derive a rule
+    and ``to_dict()`` for the response shape.
+    """
+
     id: str
-    category: str
-    tags: List[str]
+    category_id: int
+    tag_ids: Tuple[int, ...]
     name: str
     description: str
     wrong_example: str
     correct_example: str
+
+    def __init__(
+        self,
+        id: str,
+        category: str,
+        tags: Iterable[str],
+        name: str,
+        description: str,
+        wrong_example: str,
+        correct_example: str
+    ) -> None:
+        object.__setattr__(self, "id", id)
+        object.__setattr__(self, "category_id", intern_symbol(category))
+        object.__setattr__(self, "tag_ids", tuple(intern_symbol(t) for t in tags))
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "description", description)
+        object.__setattr__(self, "wrong_example", wrong_example)
+        object.__setattr__(self, "correct_example", correct_example)
+
+    def __repr__(self) -> str:
+        # Symbol ids are process-local; show the names they stand for.
+        return (
+            f"Rule(id={self.id!r}, category={self.category!r}, tags={self.tags!r}, "
+            f"name={self.name!r}, description={self.description!r}, "
+            f"wrong_example={self.wrong_example!r}, correct_example={self.correct_example!r})"
+        )
+
+    def __replace__(self, **changes) -> "Rule":
+        fields = {
+            "id": self.id,
+            "category": self.category,
+            "tags": self.tags,
+            "name": self.name,
+            "description": self.description,
+            "wrong_example": self.wrong_example,
+            "correct_example": self.correct_example,
+        }
+        unknown = changes.keys() - fields.keys()
+        if unknown:
+            raise TypeError(f"Unknown Rule fields: {sorted(unknown)}")
+        fields.update(changes)
+        return Rule(**fields)
+
+    def __reduce__(self):
+        # Pickle by name so the rule re-interns its symbols in the receiving process.
+        return (Rule, (
+            self.id, self.category, self.tags, self.name,
+            self.description, self.wrong_example, self.correct_example
+        ))
+
+    @property
+    def category(self) -> str:
+        return _SYMBOLS[self.category_id]
+
+    @property
+    def tags(self) -> Tuple[str, ...]:
+        return tuple(_SYMBOLS[t] for t in self.tag_ids)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "category": _SYMBOLS[self.category_id],
+            "tags": [_SYMBOLS[t] for t in self.tag_ids],
+            "name": self.name,
+            "description": self.description,
+            "wrong_example": self.wrong_example,
+            "correct_example": self.correct_example
+        }
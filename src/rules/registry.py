@@ -0,0 +1,54 @@
+"""Rule registry backends sharing one lookup interface."""
+
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from src.rules.base import Rule
+
+# (category_id, tag_ids) of one rule, in process symbol ids.
+SymbolRow = Tuple[int, Tuple[int, ...]]
+
+
+class RuleRegistry(Sequence):
+    """Read-only sequence of rules with id lookup and text-free filtering."""
+
+    @abstractmethod
+    def get(self, rule_id: str) -> Optional[Rule]:
+        ...
+
+    @abstractmethod
+    def rule_ids(self) -> List[str]:
+        ...
+
+    @abstractmethod
+    def symbol_rows(self) -> List[SymbolRow]:
+        """Return category and tag ids per rule, in rule order, without decoding rule text."""
+
+
+class InProcessRuleList(RuleRegistry):
+    """Registry over rules built in this process."""
+
+    def __init__(self, rules: Iterable[Rule]) -> None:
+        self._rules: List[Rule] = list(rules)
+        self._by_id: Dict[str, Rule] = {r.id: r for r in self._rules}
+        self._rows: List[SymbolRow] = [(r.category_id, r.tag_ids) for r in self._rules]
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def __getitem__(self, index):
+        return self._rules[index]
+
+    def get(self, rule_id: str) -> Optional[Rule]:
+        return self._by_id.get(rule_id)
+
+    def rule_ids(self) -> List[str]:
+        return [r.id for r in self._rules]
+
+    def symbol_rows(self) -> List[SymbolRow]:
+        return self._rows
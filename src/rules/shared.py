@@ -0,0 +1,279 @@
+"""Read-only, memory-mapped rule registry shared across worker processes.
+
+The master process packs the rule set once into a compact blob on disk.
+Every worker maps the same file read-only, so the pages live in the OS
+page cache once regardless of how many workers attach. Filters only read
+the symbol ids stored in each record; rule text is decoded when a rule is
+returned, and only a small number of recently used rules stay decoded.
+
+Blob layout (little-endian; integers are uint32):
+
+    header        magic, format version, SHA-256 digest of everything after
+                  the header, rule_count, string_count, symbol_count,
+                  tag_ref_count
+    offsets       string_count + 1 offsets into the string data
+    symbols       symbol_count string indexes of category and tag names
+    records       rule_count * (id, category symbol, name, description,
+                  wrong_example, correct_example, tags_start, tags_len)
+    tag_refs      tag_ref_count symbol indexes
+    id_index      rule_count record positions sorted by rule id
+    strings       deduplicated UTF-8 string data
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+from collections import OrderedDict
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from src.rules.base import Rule
+from src.rules.base import intern_symbol
+from src.rules.base import symbol_name
+from src.rules.registry import RuleRegistry
+from src.rules.registry import SymbolRow
+
+MAGIC = b"JRR1"
+FORMAT_VERSION = 2
+
+_HEADER = struct.Struct("<4sI32sIIII")
+_U32 = struct.Struct("<I")
+_RECORD = struct.Struct("<8I")
+
+# Decoded rules kept per worker. Bounded so a full scan does not leave a
+# private copy of every rule's text in each process.
+DECODE_CACHE_SIZE = 256
+
+
+class _Table:
+    """Insertion-ordered table that deduplicates values."""
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def add(self, value: str) -> int:
+        index = self._index.get(value)
+        if index is None:
+            index = len(self.values)
+            self._index[value] = index
+            self.values.append(value)
+        return index
+
+
+def _pack_u32(values: List[int]) -> bytes:
+    return struct.pack(f"<{len(values)}I", *values)
+
+
+def pack_rules(rules: List[Rule]) -> bytes:
+    """Serialize rules into the shared registry blob format."""
+    strings = _Table()
+    symbols = _Table()
+
+    records = bytearray()
+    tag_refs: List[int] = []
+    for rule in rules:
+        tags = rule.tags
+        tags_start = len(tag_refs)
+        tag_refs.extend(symbols.add(tag) for tag in tags)
+        records += _RECORD.pack(
+            strings.add(rule.id),
+            symbols.add(rule.category),
+            strings.add(rule.name),
+            strings.add(rule.description),
+            strings.add(rule.wrong_example),
+            strings.add(rule.correct_example),
+            tags_start,
+            len(tags),
+        )
+
+    symbol_refs = [strings.add(symbol) for symbol in symbols.values]
+
+    encoded = [s.encode("utf-8") for s in strings.values]
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+
+    id_index = sorted(range(len(rules)), key=lambda i: rules[i].id)
+
+    body = b"".join([
+        _pack_u32(offsets),
+        _pack_u32(symbol_refs),
+        bytes(records),
+        _pack_u32(tag_refs),
+        _pack_u32(id_index),
+        *encoded,
+    ])
+    digest = hashlib.sha256(body).digest()
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, digest,
+        len(rules), len(strings.values), len(symbols.values), len(tag_refs)
+    )
+    return header + body
+
+
+def blob_digest(blob: bytes) -> str:
+    """Return the hex content digest recorded in a registry blob header."""
+    return _HEADER.unpack_from(blob, 0)[2].hex()
+
+
+def publish_rules(rules: List[Rule], path: str) -> str:
+    """Write the registry blob atomically and return its content digest.
+
+    Workers only attach to a blob whose digest matches the one handed to them
+    by the publishing process, so a file left over from an earlier run is
+    never served.
+    """
+    blob = pack_rules(rules)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".rules-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return blob_digest(blob)
+
+
+class SharedRuleList(RuleRegistry):
+    """Rule registry backed by a read-only memory-mapped registry blob."""
+
+    def __init__(self, path: str, digest: str) -> None:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"Rule registry blob is truncated: '{path}'")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            header = self._validate(path, digest, size)
+        except ValueError:
+            self._map.close()
+            raise
+        rule_count, string_count, symbol_count, tag_ref_count = header
+
+        self._rule_count = rule_count
+        self._offsets_pos = _HEADER.size
+        self._symbols_pos = self._offsets_pos + (string_count + 1) * _U32.size
+        self._records_pos = self._symbols_pos + symbol_count * _U32.size
+        self._tag_refs_pos = self._records_pos + rule_count * _RECORD.size
+        self._id_index_pos = self._tag_refs_pos + tag_ref_count * _U32.size
+        self._strings_pos = self._id_index_pos + rule_count * _U32.size
+
+        # Intern every category and tag up front so symbol lookups do not
+        # depend on which rules happen to have been decoded already.
+        symbol_refs = struct.unpack_from(f"<{symbol_count}I", self._map, self._symbols_pos)
+        self._symbol_ids: Tuple[int, ...] = tuple(intern_symbol(self._string(s)) for s in symbol_refs)
+
+        self._cache: "OrderedDict[int, Rule]" = OrderedDict()
+        self._rows: Optional[List[SymbolRow]] = None
+        self._ids: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return self._rule_count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._decode(i) for i in range(*index.indices(self._rule_count))]
+        if index < 0:
+            index += self._rule_count
+        if not 0 <= index < self._rule_count:
+            raise IndexError("rule index out of range")
+        return self._decode(index)
+
+    def get(self, rule_id: str) -> Optional[Rule]:
+        """Look up a rule by id with a binary search over the sorted id index."""
+        low, high = 0, self._rule_count
+        while low < high:
+            middle = (low + high) // 2
+            position = self._id_index_at(middle)
+            current = self._string(self._record(position)[0])
+            if current == rule_id:
+                return self._decode(position)
+            if current < rule_id:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def rule_ids(self) -> List[str]:
+        if self._ids is None:
+            self._ids = [self._string(self._record(i)[0]) for i in range(self._rule_count)]
+        return list(self._ids)
+
+    def symbol_rows(self) -> List[SymbolRow]:
+        if self._rows is None:
+            # Many rules share the same tag combination; keep one tuple for each.
+            tag_tuples: Dict[Tuple[int, ...], Tuple[int, ...]] = {}
+            rows = []
+            for i in range(self._rule_count):
+                record = self._record(i)
+                tag_ids = tuple(self._symbol_ids[t] for t in self._tag_refs(record))
+                rows.append((self._symbol_ids[record[1]], tag_tuples.setdefault(tag_ids, tag_ids)))
+            self._rows = rows
+        return self._rows
+
+    def _validate(self, path: str, digest: str, size: int) -> Tuple[int, int, int, int]:
+        # The digest comes from the publisher, which hashed the body once, so
+        # attaching only checks the header and sizes and never reads every page.
+        (magic, version, blob_hash,
+         rule_count, string_count, symbol_count, tag_ref_count) = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a rule registry blob: '{path}'")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported rule registry version {version}: '{path}'")
+        if blob_hash.hex() != digest:
+            raise ValueError(f"Rule registry digest mismatch: '{path}'")
+
+        tables_size = (
+            (string_count + 1 + symbol_count + tag_ref_count + rule_count) * _U32.size
+            + rule_count * _RECORD.size
+        )
+        if size < _HEADER.size + tables_size:
+            raise ValueError(f"Rule registry blob is truncated: '{path}'")
+        strings_size = _U32.unpack_from(self._map, _HEADER.size + string_count * _U32.size)[0]
+        if size != _HEADER.size + tables_size + strings_size:
+            raise ValueError(f"Rule registry blob has the wrong size: '{path}'")
+        return rule_count, string_count, symbol_count, tag_ref_count
+
+    def _id_index_at(self, index: int) -> int:
+        return _U32.unpack_from(self._map, self._id_index_pos + index * _U32.size)[0]
+
+    def _record(self, index: int) -> tuple:
+        return _RECORD.unpack_from(self._map, self._records_pos + index * _RECORD.size)
+
+    def _tag_refs(self, record: tuple) -> tuple:
+        tags_start, tags_len = record[6], record[7]
+        return struct.unpack_from(f"<{tags_len}I", self._map, self._tag_refs_pos + tags_start * _U32.size)
+
+    def _string(self, index: int) -> str:
+        start, end = struct.unpack_from("<2I", self._map, self._offsets_pos + index * _U32.size)
+        return self._map[self._strings_pos + start:self._strings_pos + end].decode("utf-8")
+
+    def _decode(self, index: int) -> Rule:
+        rule = self._cache.get(index)
+        if rule is not None:
+            self._cache.move_to_end(index)
+        else:
+            record = self._record(index)
+            rule_id, category, name, description, wrong, correct = record[:6]
+            rule = Rule(
+                id=self._string(rule_id),
+                category=symbol_name(self._symbol_ids[category]),
+                tags=[symbol_name(self._symbol_ids[t]) for t in self._tag_refs(record)],
+                name=self._string(name),
+                description=self._string(description),
+                wrong_example=self._string(wrong),
+                correct_example=self._string(correct),
+            )
+            self._cache[index] = rule
+            if len(self._cache) > DECODE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return rule
@@ -49,18 +49,7 @@ def get_java_rules(
             "available_tags": get_all_tags()
         }
 
-    rules_data = [
-        {
-            "id": r.id,
-            "category": r.category,
-            "tags": r.tags,
-            "name": r.name,
-            "description": r.description,
-            "wrong_example": r.wrong_example,
-            "correct_example": r.correct_example
-        }
-        for r in rules
-    ]
+    rules_data = [r.to_dict() for r in rules]
 
     return {
         "status": "ok",
@@ -90,15 +79,7 @@ def get_rule_details(rule_ids: list[str]) -> dict:
     for rule_id in validated.rule_ids:
         rule = get_rule_by_id(rule_id)
         if rule:
-            rules_data.append({
-                "id": rule.id,
-                "category": rule.category,
-                "tags": rule.tags,
-                "name": rule.name,
-                "description": rule.description,
-                "wrong_example": rule.wrong_example,
-                "correct_example": rule.correct_example
-            })
+            rules_data.append(rule.to_dict())
         else:
             not_found.append(rule_id)
 
@@ -106,7 +87,7 @@ def get_rule_details(rule_ids: list[str]) -> dict:
         return {
             "status": "error",
             "message": f"No rules found for ids: {not_found}",
-            "available_rules": [r.id for r in JAVA_RULES]
+            "available_rules": JAVA_RULES.rule_ids()
         }
 
     result = {
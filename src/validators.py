@@ -81,8 +81,8 @@ class GetRuleDetailsRequest(BaseModel):
     @field_validator("rule_ids")
     @classmethod
     def validate_rule_ids(cls, value: List[str]) -> List[str]:
-        available_ids = {r.id for r in JAVA_RULES}
-        available_upper = {r.id.upper(): r.id for r in JAVA_RULES}
+        available_ids = set(JAVA_RULES.rule_ids())
+        available_upper = {rule_id.upper(): rule_id for rule_id in available_ids}
 
         validated = []
         for rule_id in value:
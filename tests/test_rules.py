@@ -0,0 +1,69 @@
+import dataclasses
+import pickle
+
+import pytest
+
+from src.rules import get_rules_by_tag
+from src.rules import get_rules_filtered
+from src.rules.base import Rule
+
+
+def make_rule() -> Rule:
+    return Rule("PACK_001", "Pack", ["teamtag", "naming"], "Name", "Description", "wrong", "correct")
+
+
+def test_repr_shows_names_not_symbol_ids():
+    text = repr(make_rule())
+    assert "category='Pack'" in text
+    assert "tags=('teamtag', 'naming')" in text
+    assert "category_id" not in text
+    assert "tag_ids" not in text
+
+
+def test_pickle_round_trip_by_name():
+    rule = make_rule()
+    restored = pickle.loads(pickle.dumps(rule))
+    assert restored == rule
+    assert restored.category == "Pack"
+    assert restored.tags == ("teamtag", "naming")
+
+
+def test_to_dict_returns_server_shape():
+    assert make_rule().to_dict() == {
+        "id": "PACK_001",
+        "category": "Pack",
+        "tags": ["teamtag", "naming"],
+        "name": "Name",
+        "description": "Description",
+        "wrong_example": "wrong",
+        "correct_example": "correct"
+    }
+
+
+def test_to_dict_is_the_supported_server_shape():
+    rule = make_rule()
+    # asdict() exposes process-local symbol ids and replace() cannot rebuild them.
+    assert dataclasses.asdict(rule) != rule.to_dict()
+    assert "category_id" in dataclasses.asdict(rule)
+    with pytest.raises(TypeError):
+        dataclasses.replace(rule, name="Other")
+
+
+def test_replace_by_name():
+    rule = make_rule()
+    renamed = rule.__replace__(name="Other", tags=["lombok"])
+    assert renamed.name == "Other"
+    assert renamed.category == "Pack"
+    assert renamed.tags == ("lombok",)
+    assert renamed.to_dict()["description"] == "Description"
+    with pytest.raises(TypeError):
+        rule.__replace__(category_id=0)
+
+
+def test_filters_match_case_insensitively():
+    upper = [r.id for r in get_rules_by_tag("NAMING")]
+    assert upper == [r.id for r in get_rules_by_tag("naming")]
+    assert upper
+    dto_ids = [r.id for r in get_rules_filtered(categories=["dto"])]
+    assert dto_ids == ["DTO_001", "DTO_002", "DTO_003"]
+    assert [r.id for r in get_rules_filtered(categories=["DTO"])] == dto_ids
@@ -0,0 +1,198 @@
+import gc
+import subprocess
+import sys
+import tracemalloc
+
+import pytest
+
+import src.rules
+import src.rules.shared as shared_module
+from src.rules import SHARED_RULES_DIGEST_ENV
+from src.rules import SHARED_RULES_PATH_ENV
+from src.rules import build_rules
+from src.rules import get_all_tags
+from src.rules import get_rules_by_tag
+from src.rules.base import Rule
+from src.rules.registry import InProcessRuleList
+from src.rules.registry import RuleRegistry
+from src.rules.shared import SharedRuleList
+from src.rules.shared import pack_rules
+from src.rules.shared import publish_rules
+
+
+@pytest.fixture
+def published(tmp_path):
+    path = str(tmp_path / "rules.bin")
+    digest = publish_rules(build_rules(), path)
+    return path, digest
+
+
+def test_round_trip_preserves_every_field(published):
+    rules = build_rules()
+    shared = SharedRuleList(*published)
+
+    assert len(shared) == len(rules)
+    for original, decoded in zip(rules, shared):
+        assert decoded.id == original.id
+        assert decoded.category == original.category
+        assert decoded.tags == original.tags
+        assert decoded.name == original.name
+        assert decoded.description == original.description
+        assert decoded.wrong_example == original.wrong_example
+        assert decoded.correct_example == original.correct_example
+    assert shared[-1] == rules[-1]
+    assert shared[1:3] == rules[1:3]
+    assert shared.rule_ids() == [r.id for r in rules]
+    assert shared.symbol_rows() == InProcessRuleList(rules).symbol_rows()
+
+
+def test_get_hits_every_id_and_misses_outside(published):
+    shared = SharedRuleList(*published)
+    ids = sorted(r.id for r in build_rules())
+
+    for rule_id in ids:
+        assert shared.get(rule_id).id == rule_id
+    assert shared.get(ids[0]).id == ids[0]
+    assert shared.get(ids[-1]).id == ids[-1]
+    assert shared.get("") is None
+    assert shared.get(ids[0][:-1]) is None
+    assert shared.get(ids[-1] + "0") is None
+    assert shared.get("~") is None
+
+
+def test_decoded_rules_are_cached(published):
+    shared = SharedRuleList(*published)
+    assert shared[0] is shared[0]
+    assert shared.get(shared[0].id) is shared[0]
+
+
+def test_full_iteration_does_not_keep_decoded_rules(tmp_path):
+    path = str(tmp_path / "rules.bin")
+    rules = [
+        Rule(f"GEN_{i:05d}", "Generated", ["generated"], f"Rule {i}", "d",
+             f"wrong {i} " + "x" * 2000, f"correct {i} " + "y" * 2000)
+        for i in range(4000)
+    ]
+    shared = SharedRuleList(path, publish_rules(rules, path))
+    del rules
+    gc.collect()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for rule in shared:
+        rule.to_dict()
+    del rule
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    # About 16 MB of example text was decoded; only the bounded cache may stay.
+    assert retained < 2 * 1024 * 1024
+
+
+def test_empty_registry(tmp_path):
+    path = str(tmp_path / "rules.bin")
+    shared = SharedRuleList(path, publish_rules([], path))
+    assert len(shared) == 0
+    assert shared.get("FORMAT_001") is None
+
+
+def test_rejects_digest_mismatch(tmp_path, published):
+    path, _ = published
+    stale_digest = publish_rules(build_rules()[:1], str(tmp_path / "stale.bin"))
+    with pytest.raises(ValueError):
+        SharedRuleList(path, stale_digest)
+
+
+@pytest.mark.parametrize("keep", [0, 10, 100, -1])
+def test_rejects_truncated_blob(tmp_path, keep):
+    blob = pack_rules(build_rules())
+    path = tmp_path / "rules.bin"
+    path.write_bytes(blob[:keep])
+    digest = blob[8:40].hex()
+    with pytest.raises(ValueError):
+        SharedRuleList(str(path), digest)
+
+
+def test_closes_map_when_validation_fails(tmp_path, published, monkeypatch):
+    path, _ = published
+    maps = []
+    real_mmap = shared_module.mmap.mmap
+
+    def recording_mmap(*args, **kwargs):
+        maps.append(real_mmap(*args, **kwargs))
+        return maps[-1]
+
+    monkeypatch.setattr(shared_module.mmap, "mmap", recording_mmap)
+    with pytest.raises(ValueError):
+        SharedRuleList(path, "0" * 64)
+    assert maps and maps[0].closed
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "rules.bin"
+    path.write_bytes(b"x" * 4096)
+    with pytest.raises(ValueError):
+        SharedRuleList(str(path), "")
+
+
+def test_load_falls_back_to_in_process_rules(tmp_path, monkeypatch, caplog):
+    path = tmp_path / "rules.bin"
+    path.write_bytes(b"")
+    monkeypatch.setenv(SHARED_RULES_PATH_ENV, str(path))
+    monkeypatch.setenv(SHARED_RULES_DIGEST_ENV, "0" * 64)
+
+    registry = src.rules._load_rules()
+
+    assert isinstance(registry, InProcessRuleList)
+    assert registry.get("FORMAT_001") is not None
+    assert "Shared rule registry unavailable" in caplog.text
+    assert str(path) in caplog.text
+
+
+def test_load_attaches_to_published_blob(tmp_path, monkeypatch):
+    path = str(tmp_path / "rules.bin")
+    digest = publish_rules([Rule("PACK_001", "Pack", ["pack"], "n", "d", "w", "c")], path)
+    monkeypatch.setenv(SHARED_RULES_PATH_ENV, path)
+    monkeypatch.setenv(SHARED_RULES_DIGEST_ENV, digest)
+
+    registry = src.rules._load_rules()
+
+    assert isinstance(registry, SharedRuleList)
+    assert registry.rule_ids() == ["PACK_001"]
+
+
+def test_registry_subclass_must_implement_interface():
+    class Incomplete(RuleRegistry):
+        def __len__(self) -> int:
+            return 0
+
+        def __getitem__(self, index):
+            raise IndexError(index)
+
+        def get(self, rule_id: str):
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_shared_registry_filters_do_not_depend_on_decode_order(tmp_path, monkeypatch):
+    # Publish from another process so this one has never interned the pack's tag.
+    path = str(tmp_path / "rules.bin")
+    script = (
+        "import sys\n"
+        "from src.rules.base import Rule\n"
+        "from src.rules.shared import publish_rules\n"
+        "rules = [Rule('PACK_001', 'Pack', ['packonlytag'], 'n', 'd', 'w', 'c'),\n"
+        "         Rule('PACK_002', 'Pack', ['other'], 'n', 'd', 'w', 'c')]\n"
+        "print(publish_rules(rules, sys.argv[1]))\n"
+    )
+    digest = subprocess.run(
+        [sys.executable, "-c", script, path], check=True, capture_output=True, text=True
+    ).stdout.strip()
+    monkeypatch.setattr(src.rules, "JAVA_RULES", SharedRuleList(path, digest))
+
+    # Nothing has been decoded yet; the tag must still resolve.
+    assert [r.id for r in get_rules_by_tag("PackOnlyTag")] == ["PACK_001"]
+    assert "packonlytag" in get_all_tags()